@@ -1,46 +1,148 @@
 #!/usr/bin/env python3
 
 import csv
+import functools
+import hashlib
 import os
 import pickle
 import re
+import threading
 from typing import Dict, List
-from collections import Counter
+from collections import Counter, defaultdict
 
 import nltk
+import numpy as np
+from joblib import Parallel, delayed
 from nltk.corpus import stopwords
 from nltk.stem import PorterStemmer
-from nltk.tokenize import word_tokenize
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score, classification_report
 from sklearn.model_selection import train_test_split
 from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import normalize
 
 
-# Ensure NLTK resources are available
-def _ensure_nltk():
+# Prefer PyStemmer (C bindings for libstemmer) when available; it is an order
+# of magnitude faster than NLTK's pure-Python PorterStemmer and can stem a
+# whole token list in one C call.
+try:
+    import Stemmer
+except ImportError:
+    Stemmer = None
+
+if Stemmer is not None:
+    _STEMMER = Stemmer.Stemmer("porter")
+    _stem_words = _STEMMER.stemWords
+
+    @functools.lru_cache(maxsize=200_000)
+    def _stem(token: str) -> str:
+        """Memoized Porter stem; shared across all classifier instances."""
+        return _STEMMER.stemWord(token)
+
+else:
+    _STEMMER = PorterStemmer()
+
+    @functools.lru_cache(maxsize=200_000)
+    def _stem(token: str) -> str:
+        """Memoized Porter stem; shared across all classifier instances."""
+        return _STEMMER.stem(token)
+
+    def _stem_words(tokens: List[str]) -> List[str]:
+        return [_stem(t) for t in tokens]
+
+
+# Tokens are lowercase alphabetic runs of 3+ chars; the length bound folds the
+# old `len(token) > 2` filter into the pattern itself.
+_TOKEN_RE = re.compile(r"[a-z]{3,}")
+
+# Built lazily by _ensure_nltk(): stopwords plus their stemmed forms, so tokens
+# that would only stem down to a stopword are dropped before paying the
+# stemming cost. frozenset hashes are precomputed, which helps the membership
+# test in the tokenize loop.
+_STOP: frozenset = frozenset()
+_nltk_ready = False
+
+
+def _ensure_nltk() -> None:
+    """Make the stopword corpus available and build the stop list.
+
+    Deferred to first use (rather than module import) so importing this
+    module stays cheap; only the stopword corpus is probed — the regex
+    tokenizer needs no Punkt data.
+    """
+    global _nltk_ready, _STOP
+    if _nltk_ready:
+        return
     try:
-        _ = stopwords.words("english")
-        word_tokenize("test")
+        raw = set(stopwords.words("english"))
     except LookupError:
         nltk.download("stopwords")
-        nltk.download("punkt")
-        try:
-            nltk.download("punkt_tab")
-        except Exception:
-            pass
+        raw = set(stopwords.words("english"))
+    _STOP = frozenset(raw | set(_stem_words(sorted(raw))))
+    _nltk_ready = True
+
+
+def _analyzer(text: str) -> List[str]:
+    """Tokenize + stem raw text; passed to TfidfVectorizer as its analyzer so
+    preprocessing happens once inside the vectorizer instead of as a separate
+    pass over the corpus."""
+    # Guarded no-op after the first call. Crucially it also runs inside
+    # loky workers, which re-import this module fresh and would otherwise
+    # tokenize against the empty _STOP placeholder.
+    _ensure_nltk()
+    return _stem_words([t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOP])
+
+
+def _ngrams(tokens: List[str]) -> List[str]:
+    """Analyzer for vectorizing already-tokenized documents. A callable
+    analyzer makes the vectorizer ignore ngram_range, so the (1, 2) n-grams
+    are built here, joined the same way sklearn would."""
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+# Below this size the loky worker startup costs more than the tokenization.
+_PARALLEL_MIN_DOCS = 500
+
+
+def _tokenize_corpus(texts: List[str]) -> List[List[str]]:
+    """Tokenize a corpus, fanning out across cores for large batches."""
+    if len(texts) > _PARALLEL_MIN_DOCS:
+        return Parallel(n_jobs=-1, backend="loky")(
+            delayed(_analyzer)(t) for t in texts
+        )
+    return [_analyzer(t) for t in texts]
+
+
+class _InplaceTfidfTransformer(TfidfTransformer):
+    """TfidfTransformer that scales CSR data in place.
 
+    The stock transform multiplies by a sparse diagonal IDF matrix, which
+    allocates a full copy of the input on every call. Indexing the IDF vector
+    by the matrix's column indices gives the same result without the copy —
+    the upstream HashingVectorizer output is ours to mutate.
+    """
 
-_ensure_nltk()
+    def transform(self, X, copy=False):
+        if copy:
+            X = X.copy()
+        if self.sublinear_tf:
+            np.log(X.data, X.data)
+            X.data += 1.0
+        if self.use_idf:
+            np.multiply(X.data, self.idf_[X.indices], out=X.data)
+        if self.norm is not None:
+            X = normalize(X, norm=self.norm, copy=False)
+        return X
 
 
 class DocumentClassificationSystem:
     def __init__(self, model_type: str = "naive_bayes", data_dir: str = "../data"):
+        _ensure_nltk()
         self.model_type = model_type
         self.data_dir = data_dir
-        self.stemmer = PorterStemmer()
-        self.stop_words = set(stopwords.words("english"))
+        self.stop_words = _STOP
         self.vectorizer = None
         self.model = None
         self.is_trained = False
@@ -92,42 +194,53 @@ class DocumentClassificationSystem:
         ]
 
     def preprocess_text(self, text: str) -> str:
-        text = text.lower()
-        text = re.sub(r"[^a-zA-Z\s]", " ", text)
-        tokens = word_tokenize(text)
-        processed_tokens = [
-            self.stemmer.stem(token)
-            for token in tokens
-            if token not in self.stop_words and len(token) > 2
-        ]
+        tokens = _TOKEN_RE.findall(text.lower())
+        processed_tokens = _stem_words(
+            [token for token in tokens if token not in self.stop_words]
+        )
         return " ".join(processed_tokens)
 
     def train_model(self) -> Dict:
         texts = [doc["text"] for doc in self.training_documents]
         labels = [self.label_encoder[doc["category"]] for doc in self.training_documents]
-        processed_texts = [self.preprocess_text(text) for text in texts]
         num_classes = len(set(labels))
         counts = Counter(labels)
         can_stratify = all(v >= 2 for v in counts.values()) and num_classes > 1
 
         # If dataset is tiny, train on all data without a test split.
         if len(labels) < max(6, num_classes * 2):
-            X_train = processed_texts
+            X_train = texts
             y_train = labels
             X_test = []
             y_test = []
         else:
             test_size = max(0.2, num_classes / len(labels))
             X_train, X_test, y_train, y_test = train_test_split(
-                processed_texts,
+                texts,
                 labels,
                 test_size=test_size,
                 random_state=42,
                 stratify=labels if can_stratify else None,
             )
 
-        self.vectorizer = TfidfVectorizer(max_features=5000, ngram_range=(1, 2))
-        X_train_vec = self.vectorizer.fit_transform(X_train)
+        # Tokenization happens once per document (in parallel for large
+        # corpora); the n-gram analyzer stops the vectorizer redoing it.
+        # Hashing is stateless, so there is no vocabulary dict to build, hold
+        # in memory, or pickle — IDF weighting is layered on top.
+        self.vectorizer = Pipeline(
+            [
+                (
+                    "hash",
+                    HashingVectorizer(
+                        n_features=2**14,
+                        alternate_sign=False,
+                        analyzer=_ngrams,
+                    ),
+                ),
+                ("tfidf", _InplaceTfidfTransformer()),
+            ]
+        )
+        X_train_vec = self.vectorizer.fit_transform(_tokenize_corpus(X_train))
 
         if self.model_type == "naive_bayes":
             self.model = MultinomialNB()
@@ -139,7 +252,7 @@ class DocumentClassificationSystem:
         accuracy = None
         report = {}
         if X_test:
-            X_test_vec = self.vectorizer.transform(X_test)
+            X_test_vec = self.vectorizer.transform(_tokenize_corpus(X_test))
             y_pred = self.model.predict(X_test_vec)
             accuracy = accuracy_score(y_test, y_pred)
             target_names = [
@@ -160,31 +273,45 @@ class DocumentClassificationSystem:
         }
 
     def classify_text(self, text: str) -> Dict:
+        return self.classify_texts([text])[0]
+
+    def classify_texts(self, texts: List[str]) -> List[Dict]:
+        """Classify a batch of texts with one transform and one predict_proba
+        call, amortizing the fixed sklearn dispatch cost across the batch."""
         if not self.is_trained:
             raise ValueError("Model must be trained before classification")
 
-        processed_text = self.preprocess_text(text)
-        text_vec = self.vectorizer.transform([processed_text])
-        prediction = self.model.predict(text_vec)[0]
-        probabilities = self.model.predict_proba(text_vec)[0]
-
-        category = self.label_decoder[prediction]
-        confidence = float(probabilities[prediction])
-        prob_dict = {
-            self.label_decoder[i]: float(prob) for i, prob in enumerate(probabilities)
-        }
-
-        explanation = self._generate_explanation(category, confidence, prob_dict)
-
-        return {
-            "predicted_category": category,
-            "confidence": confidence,
-            "probabilities": prob_dict,
-            "explanation": explanation,
-            "model_used": self.model_type,
-            "text_length": len(text),
-            "processed_text_length": len(processed_text),
-        }
+        # Tokenize once; the token lists feed the vectorizer and the
+        # processed-length stat, instead of a second tokenize+stem pass
+        token_lists = [_analyzer(t) for t in texts]
+        vecs = self.vectorizer.transform(token_lists)
+        all_probabilities = self.model.predict_proba(vecs)
+
+        results = []
+        for text, tokens, probabilities in zip(texts, token_lists, all_probabilities):
+            prediction = int(np.argmax(probabilities))
+            category = self.label_decoder[prediction]
+            confidence = float(probabilities[prediction])
+            prob_dict = {
+                self.label_decoder[i]: float(prob)
+                for i, prob in enumerate(probabilities)
+            }
+            explanation = self._generate_explanation(category, confidence, prob_dict)
+            results.append(
+                {
+                    "predicted_category": category,
+                    "confidence": confidence,
+                    "probabilities": prob_dict,
+                    "explanation": explanation,
+                    "model_used": self.model_type,
+                    "text_length": len(text),
+                    # len of " ".join(tokens) without building the string
+                    "processed_text_length": (
+                        sum(map(len, tokens)) + max(len(tokens) - 1, 0)
+                    ),
+                }
+            )
+        return results
 
     def _generate_explanation(self, category: str, confidence: float, probabilities: Dict[str, float]) -> str:
         sorted_probs = sorted(probabilities.items(), key=lambda x: x[1], reverse=True)
@@ -240,15 +367,54 @@ class DocumentClassificationSystem:
 
 _classifiers: Dict[str, DocumentClassificationSystem] = {}
 
+# Serializes first-touch training per model type so concurrent cold-start
+# requests don't each run a full TF-IDF fit + model fit.
+_train_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+
+_MODEL_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".model_cache"
+)
+
+
+def _training_data_digest(data_dir: str) -> str:
+    """Digest of the training CSV; stale cache files simply stop matching."""
+    training_file = os.path.join(data_dir, "training_documents.csv")
+    try:
+        with open(training_file, "rb") as f:
+            return hashlib.blake2b(f.read()).hexdigest()[:16]
+    except FileNotFoundError:
+        return ""
+
 
 def _get_classifier(model_type: str = "naive_bayes") -> DocumentClassificationSystem:
-    if model_type not in _classifiers:
-        _classifiers[model_type] = DocumentClassificationSystem(model_type=model_type)
-        try:
-            _classifiers[model_type].train_model()
-        except Exception as e:
-            print(f"Warning: Could not auto-train {model_type} model: {e}")
-    return _classifiers[model_type]
+    if model_type in _classifiers:
+        return _classifiers[model_type]
+    with _train_locks[model_type]:
+        # A concurrent caller may have finished training while we waited.
+        if model_type in _classifiers:
+            return _classifiers[model_type]
+        classifier = DocumentClassificationSystem(model_type=model_type)
+        digest = _training_data_digest(classifier.data_dir)
+        cache_path = (
+            os.path.join(_MODEL_CACHE_DIR, f"model_{model_type}_{digest}.pkl")
+            if digest
+            else None
+        )
+        if cache_path and os.path.exists(cache_path):
+            try:
+                classifier.load_model(cache_path)
+            except Exception as e:
+                print(f"Warning: Could not load cached {model_type} model: {e}")
+        if not classifier.is_trained:
+            try:
+                classifier.train_model()
+                if cache_path:
+                    os.makedirs(_MODEL_CACHE_DIR, exist_ok=True)
+                    classifier.save_model(cache_path)
+            except Exception as e:
+                print(f"Warning: Could not auto-train {model_type} model: {e}")
+        _classifiers[model_type] = classifier
+        return classifier
 
 
 def classify_document(text: str, model_type: str = "naive_bayes") -> Dict:
@@ -256,6 +422,11 @@ def classify_document(text: str, model_type: str = "naive_bayes") -> Dict:
     return classifier.classify_text(text)
 
 
+def classify_documents(texts: List[str], model_type: str = "naive_bayes") -> List[Dict]:
+    classifier = _get_classifier(model_type)
+    return classifier.classify_texts(texts)
+
+
 def get_model_info(model_type: str = "naive_bayes") -> Dict:
     classifier = _get_classifier(model_type)
     return classifier.get_model_info()
@@ -1,16 +1,21 @@
+import asyncio
+import functools
 import logging
 import os
-import time
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
 
 from search import SearchEngine, load_publications
-from classification_ml import classify_document, get_model_info, train_models
+from classification_ml import classify_documents, get_model_info, train_models
 from dotenv import load_dotenv
 
-app = FastAPI()
+# orjson serializes response bodies in C — the difference is most visible on
+# /search responses carrying pages of abstracts.
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Load env config
 load_dotenv()
@@ -37,24 +42,84 @@ publications_data = load_publications(
 )
 search_engine = SearchEngine(publications_data)
 
-_search_cache = {}
-
-
-def _cache_get(key: str):
-    entry = _search_cache.get(key)
-    if not entry:
-        return None
-    if time.time() - entry["ts"] > SEARCH_CACHE_TTL:
-        _search_cache.pop(key, None)
-        return None
-    return entry["value"]
-
-
-def _cache_set(key: str, value):
-    if len(_search_cache) >= SEARCH_CACHE_MAX:
-        oldest = min(_search_cache.items(), key=lambda item: item[1]["ts"])
-        _search_cache.pop(oldest[0], None)
-    _search_cache[key] = {"ts": time.time(), "value": value}
+RETURN_FIELDS = ("title", "link", "authors", "published_date", "abstract", "score")
+
+
+def _format_publication(pub: dict) -> dict:
+    item = dict(pub)
+    item["score"] = 0.0
+    if not isinstance(item.get("authors", []), list):
+        item["authors"] = (
+            item.get("authors", "").split(", ") if item.get("authors") else []
+        )
+    return {k: item.get(k, "") for k in RETURN_FIELDS}
+
+
+# The empty-query response is deterministic, so build it once at startup
+# instead of copying and normalizing every publication per request.
+_ALL_RESULTS = [_format_publication(pub) for pub in publications_data]
+
+@functools.lru_cache(maxsize=SEARCH_CACHE_MAX)
+def _cached_search(key: str) -> tuple:
+    """LRU-cached search on the normalized query; returns an immutable tuple
+    so cached results cannot be mutated by callers."""
+    return tuple(search_engine.search(key))
+
+
+@app.on_event("startup")
+async def _start_cache_expiry():
+    # lru_cache has no TTL, so drop the whole cache every SEARCH_CACHE_TTL
+    # seconds to keep results from going stale after a recrawl.
+    async def _expire():
+        while True:
+            await asyncio.sleep(SEARCH_CACHE_TTL)
+            _cached_search.cache_clear()
+
+    asyncio.create_task(_expire())
+
+
+# Micro-batching for /classify: requests arriving within a short window are
+# vectorized and scored together, so one sparse transform + predict_proba
+# serves the whole batch instead of one sklearn round trip per request.
+CLASSIFY_BATCH_MAX = 32
+CLASSIFY_BATCH_WINDOW = 0.005  # seconds
+
+_classify_queue: "asyncio.Queue[tuple]" = asyncio.Queue()
+
+
+async def _classify_batcher():
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _classify_queue.get()]
+        deadline = loop.time() + CLASSIFY_BATCH_WINDOW
+        while len(batch) < CLASSIFY_BATCH_MAX:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_classify_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        groups: dict = {}
+        for item in batch:
+            groups.setdefault(item[0], []).append(item)
+        for model_type, items in groups.items():
+            texts = [text for _, text, _ in items]
+            try:
+                results = await run_in_threadpool(classify_documents, texts, model_type)
+                for (_, _, future), result in zip(items, results):
+                    if not future.done():
+                        future.set_result(result)
+            except Exception as e:
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+
+
+@app.on_event("startup")
+async def _start_classify_batcher():
+    asyncio.create_task(_classify_batcher())
 
 
 class ClassificationRequest(BaseModel):
@@ -71,7 +136,7 @@ def health():
     return {
         "status": "ok",
         "publications": len(publications_data),
-        "cache_entries": len(_search_cache),
+        "cache_entries": _cached_search.cache_info().currsize,
         "data_dir": DATA_DIR,
     }
 
@@ -80,32 +145,9 @@ def health():
 def search_publications(query: str = "", page: int = 1, size: int = 10):
     try:
         if not query.strip():
-            results = []
-            for pub in publications_data:
-                item = dict(pub)
-                item["score"] = 0.0
-                if not isinstance(item.get("authors", []), list):
-                    item["authors"] = (
-                        item.get("authors", "").split(", ") if item.get("authors") else []
-                    )
-                return_fields = [
-                    "title",
-                    "link",
-                    "authors",
-                    "published_date",
-                    "abstract",
-                    "score",
-                ]
-                formatted_item = {k: item.get(k, "") for k in return_fields}
-                results.append(formatted_item)
+            results = _ALL_RESULTS
         else:
-            key = query.strip().lower()
-            cached = _cache_get(key)
-            if cached is None:
-                results = search_engine.search(query)
-                _cache_set(key, results)
-            else:
-                results = cached
+            results = _cached_search(query.strip().lower())
 
         start_idx = (page - 1) * size
         end_idx = start_idx + size
@@ -124,11 +166,13 @@ def search_publications(query: str = "", page: int = 1, size: int = 10):
 
 
 @app.post("/classify")
-def classify_text(request: ClassificationRequest):
+async def classify_text(request: ClassificationRequest):
     if not request.text.strip():
         return {"error": "Text is required for classification"}
     try:
-        return classify_document(request.text, request.model_type)
+        future = asyncio.get_running_loop().create_future()
+        await _classify_queue.put((request.model_type, request.text, future))
+        return await future
     except Exception as e:
         return {"error": str(e)}
 
@@ -4,11 +4,13 @@ OpenAlex crawler for data-science testing data.
 Generates publications.json/publications_links.json compatible with the app.
 """
 import argparse
-import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+import numpy as np
+import orjson
 import requests
 
 OPENALEX_BASE = "https://api.openalex.org/works"
@@ -18,11 +20,14 @@ def _decode_abstract(inv_idx: Dict) -> str:
     """Convert OpenAlex inverted index to a string."""
     if not inv_idx:
         return ""
-    pos_to_word = {}
-    for word, positions in inv_idx.items():
-        for pos in positions:
-            pos_to_word[pos] = word
-    return " ".join(pos_to_word[i] for i in sorted(pos_to_word.keys()))
+    # Flatten to parallel word/position arrays and let numpy argsort put the
+    # words back in reading order — no intermediate position→word dict.
+    words = [w for w, positions in inv_idx.items() for _ in positions]
+    positions = np.fromiter(
+        (p for ps in inv_idx.values() for p in ps), dtype=np.int32, count=len(words)
+    )
+    order = np.argsort(positions, kind="stable")
+    return " ".join(words[i] for i in order)
 
 
 def _authors_list(authorships: List[Dict]) -> List[Dict]:
@@ -47,6 +52,18 @@ def _record_from_work(w: Dict) -> Dict:
     }
 
 
+def _fetch_page(
+    session: requests.Session, params: Dict, headers: Dict, delay: float
+) -> Dict:
+    """Fetch one OpenAlex page; the politeness delay runs in the worker
+    thread so it overlaps with parsing instead of blocking it."""
+    if delay > 0:
+        time.sleep(delay)
+    r = session.get(OPENALEX_BASE, params=params, headers=headers, timeout=30)
+    r.raise_for_status()
+    return r.json()
+
+
 def main():
     ap = argparse.ArgumentParser(description="OpenAlex data-science crawler")
     ap.add_argument("--outdir", default="../data")
@@ -64,38 +81,51 @@ def main():
     if args.mailto:
         headers["User-Agent"] += f" (mailto:{args.mailto})"
 
-    cursor = "*"
     records: List[Dict] = []
     links: List[Dict] = []
 
-    while len(records) < args.max_records:
-        params = {
+    def _params(cursor: str) -> Dict:
+        return {
             "search": args.query,
             "per-page": min(200, args.per_page),
             "cursor": cursor,
         }
-        r = requests.get(OPENALEX_BASE, params=params, headers=headers, timeout=30)
-        r.raise_for_status()
-        data = r.json()
-        works = data.get("results", [])
-        if not works:
-            break
-        for w in works:
-            rec = _record_from_work(w)
-            records.append(rec)
-            links.append({"title": rec["title"], "link": rec["link"]})
-            if len(records) >= args.max_records:
-                break
-        cursor = data.get("meta", {}).get("next_cursor")
-        if not cursor:
-            break
-        time.sleep(args.sleep)
 
-    (outdir / "publications.json").write_text(
-        json.dumps(records, ensure_ascii=False, indent=2), encoding="utf-8"
+    # A Session reuses the TCP/TLS connection across pages, and a one-slot
+    # prefetch future keeps the next HTTP request in flight while the current
+    # page's works are being parsed.
+    session = requests.Session()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending: Optional[object] = executor.submit(
+            _fetch_page, session, _params("*"), headers, 0.0
+        )
+        while pending is not None and len(records) < args.max_records:
+            data = pending.result()
+            pending = None
+            works = data.get("results", [])
+            if not works:
+                break
+            cursor = data.get("meta", {}).get("next_cursor")
+            if cursor and len(records) + len(works) < args.max_records:
+                pending = executor.submit(
+                    _fetch_page, session, _params(cursor), headers, args.sleep
+                )
+            for w in works:
+                rec = _record_from_work(w)
+                records.append(rec)
+                links.append({"title": rec["title"], "link": rec["link"]})
+                if len(records) >= args.max_records:
+                    break
+        if pending is not None:
+            pending.cancel()
+
+    # orjson serializes straight to UTF-8 bytes in C — no intermediate Python
+    # string and no re-encode on write.
+    (outdir / "publications.json").write_bytes(
+        orjson.dumps(records, option=orjson.OPT_INDENT_2)
     )
-    (outdir / "publications_links.json").write_text(
-        json.dumps(links, ensure_ascii=False, indent=2), encoding="utf-8"
+    (outdir / "publications_links.json").write_bytes(
+        orjson.dumps(links, option=orjson.OPT_INDENT_2)
     )
     print(f"[DONE] Saved {len(records)} records → {outdir / 'publications.json'}")
 
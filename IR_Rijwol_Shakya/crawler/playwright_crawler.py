@@ -2,17 +2,19 @@
 """
 Playwright crawler with persistent profile to pass captcha once.
 Run first time with --headless=0 to solve captcha, then reuse the profile.
+Detail pages are scraped by a small pool of concurrent tabs sharing the
+persistent context.
 """
 import argparse
+import asyncio
 import json
 import os
 import re
-import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
-from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
+from playwright.async_api import async_playwright, TimeoutError as PWTimeout
 
 DEFAULT_PORTAL_ROOT = os.getenv("PORTAL_ROOT", "https://pureportal.coventry.ac.uk")
 DEFAULT_BASE_URL = os.getenv(
@@ -26,9 +28,11 @@ NAME_PAIR = re.compile(
     r"[A-Z][A-Za-z'’\-]+,\s*(?:[A-Z](?:\.)?)(?:\s*[A-Z](?:\.)?)*", flags=re.UNICODE
 )
 SPACE = re.compile(r"\s+")
+# "A & B" / "A and B" author separators, normalized in a single pass.
+AUTHOR_SEP = re.compile(r"\s+&\s+|\s+and\s+")
 
 
-def _uniq_str(seq: List[str]) -> List[str]:
+def _uniq_str(seq) -> List[str]:
     seen, out = set(), []
     for x in seq:
         x = x.strip()
@@ -81,15 +85,15 @@ def _looks_like_person_name(text: str) -> bool:
     return ((" " in t) or ("," in t)) and sum(ch.isalpha() for ch in t) >= 4
 
 
-def _authors_from_page(page) -> List[Dict]:
-    anchors = page.query_selector_all("a[href*='/en/persons/']")
+async def _authors_from_page(page) -> List[Dict]:
+    anchors = await page.query_selector_all("a[href*='/en/persons/']")
     candidates: List[Dict[str, Optional[str]]] = []
     for a in anchors:
         try:
-            href = (a.get_attribute("href") or "").strip()
+            href = (await a.get_attribute("href") or "").strip()
             if not _is_person_profile_url(href):
                 continue
-            text = (a.inner_text() or "").strip()
+            text = (await a.inner_text() or "").strip()
             if not _looks_like_person_name(text):
                 continue
             candidates.append({"name": text, "profile": urljoin(page.url, href)})
@@ -98,13 +102,15 @@ def _authors_from_page(page) -> List[Dict]:
     return _uniq_authors(candidates)
 
 
-def _authors_from_subtitle(page, title_text: str) -> List[str]:
-    date_el = page.query_selector("span.date")
+async def _authors_from_subtitle(page, title_text: str) -> List[str]:
+    date_el = await page.query_selector("span.date")
     if not date_el:
         return []
     try:
-        subtitle = date_el.evaluate_handle("el => el.closest('.subtitle') || el.parentElement")
-        line = subtitle.evaluate("el => el.innerText") if subtitle else ""
+        subtitle = await date_el.evaluate_handle(
+            "el => el.closest('.subtitle') || el.parentElement"
+        )
+        line = await subtitle.evaluate("el => el.innerText") if subtitle else ""
     except Exception:
         line = ""
     if title_text and title_text in line:
@@ -112,45 +118,46 @@ def _authors_from_subtitle(page, title_text: str) -> List[str]:
     line = " ".join(line.split()).strip()
     m = FIRST_DIGIT.search(line)
     pre_date = line[: m.start()].strip(" -—–·•,;|") if m else line
-    pre_date = pre_date.replace(" & ", ", ").replace(" and ", ", ")
-    pairs = NAME_PAIR.findall(pre_date)
-    return _uniq_str(pairs)
+    pre_date = AUTHOR_SEP.sub(", ", pre_date)
+    return _uniq_str(m.group(0) for m in NAME_PAIR.finditer(pre_date))
 
 
 def _wrap_names_as_objs(names: List[str]) -> List[Dict]:
     return _uniq_authors([{"name": n, "profile": None} for n in names])
 
 
-def _extract_detail(page, link: str, title_hint: str) -> Dict:
-    page.goto(link, wait_until="domcontentloaded")
-    time.sleep(0.2)
+async def _extract_detail(page, link: str, title_hint: str) -> Dict:
+    await page.goto(link, wait_until="domcontentloaded")
+    await asyncio.sleep(0.2)
 
     title = title_hint or ""
     try:
-        h1 = page.query_selector("h1")
+        h1 = await page.query_selector("h1")
         if h1:
-            title = h1.inner_text().strip()
+            title = (await h1.inner_text()).strip()
     except Exception:
         pass
 
     published_date = ""
     try:
-        date_el = page.query_selector("span.date")
+        date_el = await page.query_selector("span.date")
         if date_el:
-            published_date = date_el.inner_text().strip()
+            published_date = (await date_el.inner_text()).strip()
     except Exception:
         pass
 
-    author_objs = _authors_from_page(page)
+    author_objs = await _authors_from_page(page)
     if not author_objs:
-        names = _authors_from_subtitle(page, title)
+        names = await _authors_from_subtitle(page, title)
         author_objs = _wrap_names_as_objs(names)
 
     abstract_txt = ""
     try:
-        candidates = page.query_selector_all("div.textblock, div.abstract, section.abstract")
+        candidates = await page.query_selector_all(
+            "div.textblock, div.abstract, section.abstract"
+        )
         for c in candidates:
-            txt = (c.inner_text() or "").strip()
+            txt = (await c.inner_text() or "").strip()
             if len(txt) > 40:
                 abstract_txt = txt[:1000]
                 break
@@ -166,19 +173,19 @@ def _extract_detail(page, link: str, title_hint: str) -> Dict:
     }
 
 
-def _gather_listing(page, base_url: str, max_pages: int) -> List[Dict]:
+async def _gather_listing(page, base_url: str, max_pages: int) -> List[Dict]:
     all_rows: List[Dict] = []
     for page_idx in range(max_pages):
         url = f"{base_url}?page={page_idx}"
-        page.goto(url, wait_until="domcontentloaded")
+        await page.goto(url, wait_until="domcontentloaded")
         try:
-            page.wait_for_selector(".result-container h3.title a", timeout=8000)
+            await page.wait_for_selector(".result-container h3.title a", timeout=8000)
         except PWTimeout:
             pass
         rows = []
-        for a in page.query_selector_all(".result-container h3.title a"):
-            title = (a.inner_text() or "").strip()
-            link = a.get_attribute("href") or ""
+        for a in await page.query_selector_all(".result-container h3.title a"):
+            title = (await a.inner_text() or "").strip()
+            link = await a.get_attribute("href") or ""
             if title and link:
                 rows.append({"title": title, "link": link})
         if rows:
@@ -193,75 +200,105 @@ def _gather_listing(page, base_url: str, max_pages: int) -> List[Dict]:
     return list(uniq.values())
 
 
-def main():
-    ap = argparse.ArgumentParser(description="Playwright crawler (persistent profile).")
-    ap.add_argument("--outdir", default="../data")
-    ap.add_argument("--base-url", default=DEFAULT_BASE_URL)
-    ap.add_argument("--max-pages", type=int, default=10)
-    ap.add_argument("--user-data-dir", default="./pw-profile")
-    ap.add_argument("--headless", type=int, default=0, help="0 = visible, 1 = headless")
-    ap.add_argument(
-        "--wait-for-human",
-        action="store_true",
-        help="Pause before crawling so you can solve captcha.",
-    )
-    args = ap.parse_args()
-
+async def _detail_worker(
+    context, items: List[Tuple[int, Dict]], results: List[Optional[Dict]], progress: Dict
+):
+    """Scrape one shard of the listing in its own tab."""
+    page = await context.new_page()
+    try:
+        for idx, it in items:
+            try:
+                rec = await _extract_detail(page, it["link"], it.get("title", ""))
+            except Exception as e:
+                print(f"[DETAIL] ERR {it['link']}: {str(e)[:100]}")
+                rec = {
+                    "title": it.get("title", ""),
+                    "link": it["link"],
+                    "authors": [],
+                    "published_date": "",
+                    "abstract": "",
+                }
+            results[idx] = rec
+            progress["done"] += 1
+            if progress["done"] % 5 == 0:
+                print(f"[DETAIL] {progress['done']}/{progress['total']} parsed")
+    finally:
+        await page.close()
+
+
+async def _run(args) -> None:
     outdir = Path(args.outdir)
     outdir.mkdir(parents=True, exist_ok=True)
 
-    with sync_playwright() as p:
-        context = p.chromium.launch_persistent_context(
+    async with async_playwright() as p:
+        context = await p.chromium.launch_persistent_context(
             args.user_data_dir,
             headless=bool(args.headless),
             viewport={"width": 1366, "height": 900},
         )
-        page = context.new_page()
+        page = await context.new_page()
 
         if args.wait_for_human and not args.headless:
             # Navigate to the listing page so the captcha is visible.
-            page.goto(args.base_url, wait_until="domcontentloaded")
+            await page.goto(args.base_url, wait_until="domcontentloaded")
             print("Solve the captcha in the opened browser tab, then press Enter here to continue...")
             input()
 
         print("[STAGE 1] Collecting listing links…")
-        listing = _gather_listing(page, args.base_url, args.max_pages)
+        listing = await _gather_listing(page, args.base_url, args.max_pages)
+        await page.close()
         if not listing:
             print("No publications found on listing pages.")
-            context.close()
+            await context.close()
             return
 
         (outdir / "publications_links.json").write_text(
             json.dumps(listing, indent=2), encoding="utf-8"
         )
 
-        print("[STAGE 2] Scraping details…")
-        results = []
-        for i, it in enumerate(listing, 1):
-            try:
-                rec = _extract_detail(page, it["link"], it.get("title", ""))
-                results.append(rec)
-                if i % 5 == 0:
-                    print(f"[DETAIL] {i}/{len(listing)} parsed")
-            except Exception as e:
-                print(f"[DETAIL] ERR {it['link']}: {str(e)[:100]}")
-                results.append(
-                    {
-                        "title": it.get("title", ""),
-                        "link": it["link"],
-                        "authors": [],
-                        "published_date": "",
-                        "abstract": "",
-                    }
-                )
+        # Keep the tab count small; the cookies/captcha token of the
+        # persistent context are shared, but too many parallel tabs trips
+        # Cloudflare.
+        workers = max(1, min(args.workers, 4, len(listing)))
+        print(f"[STAGE 2] Scraping details with {workers} tabs…")
+        indexed = list(enumerate(listing))
+        shards = [indexed[w::workers] for w in range(workers)]
+        results: List[Optional[Dict]] = [None] * len(listing)
+        progress = {"done": 0, "total": len(listing)}
+        await asyncio.gather(
+            *[_detail_worker(context, shard, results, progress) for shard in shards]
+        )
 
         (outdir / "publications.json").write_text(
             json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8"
         )
 
-        context.close()
+        await context.close()
         print(f"[DONE] Saved {len(results)} records → {outdir / 'publications.json'}")
 
 
+def main():
+    ap = argparse.ArgumentParser(description="Playwright crawler (persistent profile).")
+    ap.add_argument("--outdir", default="../data")
+    ap.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    ap.add_argument("--max-pages", type=int, default=10)
+    ap.add_argument("--user-data-dir", default="./pw-profile")
+    ap.add_argument("--headless", type=int, default=0, help="0 = visible, 1 = headless")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent tabs for detail pages (capped at 4).",
+    )
+    ap.add_argument(
+        "--wait-for-human",
+        action="store_true",
+        help="Pause before crawling so you can solve captcha.",
+    )
+    args = ap.parse_args()
+
+    asyncio.run(_run(args))
+
+
 if __name__ == "__main__":
     main()
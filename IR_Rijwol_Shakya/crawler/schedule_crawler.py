@@ -2,22 +2,29 @@
 """
 Weekly scheduler for the crawler (Sunday at midnight).
 """
-import subprocess
+import sys
 import time
-import os
+
 from apscheduler.schedulers.background import BackgroundScheduler
 
-VENV_PATH = os.path.join(os.path.dirname(__file__), "..", ".venv", "bin", "activate")
-CRAWLER_SCRIPT = os.path.join(os.path.dirname(__file__), "playwright_crawler.py")
+from playwright_crawler import main as run_playwright_crawler
 
 
 def run_crawler():
+    # In-process call: no shell, no venv re-activation, no fresh interpreter
+    # paying the playwright import cost — and exceptions surface here instead
+    # of vanishing into a subprocess.
     print("[Scheduler] Running crawler...")
-    subprocess.run(
-        f"source {VENV_PATH} && python {CRAWLER_SCRIPT}",
-        shell=True,
-        check=False,
-    )
+    argv = sys.argv
+    sys.argv = argv[:1]  # let the crawler's argparse see its defaults
+    try:
+        run_playwright_crawler()
+    except SystemExit:
+        pass
+    except Exception as e:
+        print(f"[Scheduler] Crawler failed: {e}")
+    finally:
+        sys.argv = argv
     print("[Scheduler] Crawler finished.")
 
 
@@ -10,40 +10,104 @@ following the assignment requirements:
 3. Classify new documents using the trained model
 """
 
+import hashlib
 import json
 import re
 import pickle
 import os
 import csv
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
-import nltk
-from nltk.corpus import stopwords
-from nltk.stem import PorterStemmer
-from nltk.tokenize import word_tokenize
+from nlp_common import STOP, stem_words
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
 from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import normalize
 from sklearn.naive_bayes import MultinomialNB
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report, accuracy_score
 import numpy as np
 
 
-# Ensure NLTK resources are available
-def _ensure_nltk():
-    try:
-        _ = stopwords.words("english")
-        word_tokenize("test")
-    except LookupError:
-        nltk.download("stopwords")
-        nltk.download("punkt")
-        try:
-            nltk.download("punkt_tab")
-        except Exception:
-            pass
+# Tokens are lowercase alphabetic runs, matched in one findall pass over the
+# lowercased text.
+_TOKEN_RE = re.compile(r"[a-z]+")
 
 
-_ensure_nltk()
+def _vec_tokenizer(text: str) -> List[str]:
+    """Tokenizer plugged into the vectorizer: lowercase, tokenize, drop
+    stopwords and short tokens, stem — all in one pass over the string.
+    Module-level (not a lambda) so trained pipelines stay picklable."""
+    return stem_words(
+        [
+            token
+            for token in _TOKEN_RE.findall(text.lower())
+            if token not in STOP and len(token) > 2
+        ]
+    )
+
+
+def _pretokenized_analyzer(tokens: List[str]) -> List[str]:
+    """Analyzer for input that is already a token list: reproduces the
+    extractor's (1, 2) n-grams exactly as sklearn's analyzer would build
+    them from _vec_tokenizer output."""
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+class _InplaceTfidfTransformer(TfidfTransformer):
+    """TfidfTransformer whose transform scales X.data in place.
+
+    The stock transform multiplies by a sparse diagonal IDF matrix, which
+    allocates a fresh CSR copy of size nnz on every /classify call. The
+    hashing stage hands us a matrix nobody else references, so scaling its
+    data array directly is safe and skips that allocation."""
+
+    def transform(self, X, copy=False):
+        if self.sublinear_tf:
+            np.log(X.data, X.data)
+            X.data += 1
+        if self.use_idf:
+            np.multiply(X.data, self.idf_[X.indices], out=X.data)
+        if self.norm is not None:
+            X = normalize(X, norm=self.norm, copy=False)
+        return X
+
+
+def _build_feature_extractor() -> Pipeline:
+    """Hashing vectorizer with preprocessing fused into its tokenizer.
+    Stateless hashing skips the vocabulary dict at both fit and transform
+    time (and keeps it out of the pickled model); alternate_sign=False
+    keeps counts non-negative for MultinomialNB, and TfidfTransformer
+    layers IDF weighting back on top."""
+    vectorizer = HashingVectorizer(
+        n_features=2**18,
+        ngram_range=(1, 2),
+        alternate_sign=False,
+        lowercase=False,
+        tokenizer=_vec_tokenizer,
+        token_pattern=None,
+        # float32 is plenty for tf-idf weights and halves the memory
+        # bandwidth through the transform/predict path
+        dtype=np.float32,
+    )
+    return Pipeline([("hash", vectorizer), ("tfidf", _InplaceTfidfTransformer())])
+
+
+# Fitted extractor + transformed training matrix, keyed by data dir and
+# training-CSV digest. Preprocessing is identical for every model type, so
+# it runs once and both classifiers fit on the same matrix.
+_FEATURE_CACHE: Dict[str, Tuple] = {}
+
+
+def _prepare_features(data_dir: str, texts: Tuple[str, ...]) -> Tuple:
+    key = f"{data_dir}:{_training_data_digest(data_dir)}"
+    cached = _FEATURE_CACHE.get(key)
+    if cached is None:
+        extractor = _build_feature_extractor()
+        X = extractor.fit_transform(list(texts))
+        cached = _FEATURE_CACHE[key] = (extractor, X)
+    return cached
 
 
 class DocumentClassificationSystem:
@@ -57,10 +121,8 @@ class DocumentClassificationSystem:
         """
         self.model_type = model_type
         self.data_dir = data_dir
-        self.stemmer = PorterStemmer()
-        self.stop_words = set(stopwords.words("english"))
-        self.vectorizer = None
-        self.model = None
+        self.stop_words = STOP
+        self.pipeline = None
         self.is_trained = False
 
         # Load categories and create label encoders
@@ -71,6 +133,11 @@ class DocumentClassificationSystem:
         # Load training documents from CSV
         self.training_documents = self._load_training_documents()
 
+        # Vectorized views of the training docs: stats and label encoding
+        # run at C level instead of re-sweeping the doc list in Python
+        self._df = pd.DataFrame(self.training_documents)
+        self._labels = self._df["category"].map(self.label_encoder).to_numpy()
+
     def _load_categories(self) -> List[str]:
         """Load categories from CSV file"""
         categories_file = os.path.join(self.data_dir, "categories.csv")
@@ -137,12 +204,9 @@ class DocumentClassificationSystem:
 
     def get_training_stats(self) -> Dict:
         """Get statistics about the training data"""
-        stats = {}
-        for category in self.categories:
-            count = sum(
-                1 for doc in self.training_documents if doc["category"] == category
-            )
-            stats[category] = count
+        counts = self._df["category"].value_counts().to_dict()
+        # value_counts drops empty categories; keep them at 0 in the stats
+        stats = {category: counts.get(category, 0) for category in self.categories}
         stats["total"] = len(self.training_documents)
         return stats
 
@@ -156,21 +220,17 @@ class DocumentClassificationSystem:
         Returns:
             str: Preprocessed text
         """
-        # Convert to lowercase
-        text = text.lower()
-
-        # Remove punctuation and special characters
-        text = re.sub(r"[^a-zA-Z\s]", " ", text)
-
-        # Tokenize
-        tokens = word_tokenize(text)
-
-        # Remove stopwords and stem
-        processed_tokens = [
-            self.stemmer.stem(token)
-            for token in tokens
-            if token not in self.stop_words and len(token) > 2
-        ]
+        # Tokenize (lowercases and drops punctuation in the same pass)
+        tokens = _TOKEN_RE.findall(text.lower())
+
+        # Remove stopwords, then stem the surviving tokens as one batch
+        processed_tokens = stem_words(
+            [
+                token
+                for token in tokens
+                if token not in self.stop_words and len(token) > 2
+            ]
+        )
 
         return " ".join(processed_tokens)
 
@@ -181,35 +241,37 @@ class DocumentClassificationSystem:
         Returns:
             Dict: Training results including accuracy and classification report
         """
-        # Prepare training data
-        texts = [doc["text"] for doc in self.training_documents]
-        labels = [
-            self.label_encoder[doc["category"]] for doc in self.training_documents
-        ]
-
-        # Preprocess texts
-        processed_texts = [self.preprocess_text(text) for text in texts]
-
-        # Split data for training and testing
-        X_train, X_test, y_train, y_test = train_test_split(
-            processed_texts, labels, test_size=0.2, random_state=42, stratify=labels
+        # Prepare training data (single C-level copy; labels are already a
+        # numpy array built at load time)
+        texts = self._df["text"].tolist()
+        labels = self._labels
+
+        # Vectorize once via the shared, memoized extractor — the features
+        # are identical for both model types, so the second model's training
+        # skips tokenization and hashing entirely
+        extractor, X_all = _prepare_features(self.data_dir, tuple(texts))
+
+        # Split row indices for training and testing (fixed seed, so both
+        # model types see the same split)
+        train_idx, test_idx = train_test_split(
+            np.arange(len(labels)), test_size=0.2, random_state=42, stratify=labels
         )
+        X_train, X_test = X_all[train_idx], X_all[test_idx]
+        y_train, y_test = labels[train_idx], labels[test_idx]
 
-        # Vectorize text
-        self.vectorizer = TfidfVectorizer(max_features=5000, ngram_range=(1, 2))
-        X_train_vec = self.vectorizer.fit_transform(X_train)
-        X_test_vec = self.vectorizer.transform(X_test)
-
-        # Train model
+        # Model
         if self.model_type == "naive_bayes":
-            self.model = MultinomialNB()
+            model = MultinomialNB()
         else:  # logistic_regression
-            self.model = LogisticRegression(random_state=42, max_iter=1000)
+            model = LogisticRegression(random_state=42, max_iter=1000)
+
+        model.fit(X_train, y_train)
 
-        self.model.fit(X_train_vec, y_train)
+        # Full pipeline for inference: shared fitted extractor + own model
+        self.pipeline = Pipeline(list(extractor.steps) + [("clf", model)])
 
         # Evaluate model
-        y_pred = self.model.predict(X_test_vec)
+        y_pred = model.predict(X_test)
         accuracy = accuracy_score(y_test, y_pred)
 
         # Generate classification report
@@ -226,8 +288,9 @@ class DocumentClassificationSystem:
             "accuracy": accuracy,
             "classification_report": report,
             "model_type": self.model_type,
-            "training_size": len(X_train),
-            "test_size": len(X_test),
+            # len() on a sparse matrix raises; shape[0] is the row count
+            "training_size": X_train.shape[0],
+            "test_size": X_test.shape[0],
             "categories": self.categories,
         }
 
@@ -241,40 +304,80 @@ class DocumentClassificationSystem:
         Returns:
             Dict: Classification results
         """
-        if not self.is_trained:
-            raise ValueError("Model must be trained before classification")
-
-        # Preprocess text
-        processed_text = self.preprocess_text(text)
+        return self.classify_texts([text])[0]
 
-        # Vectorize
-        text_vec = self.vectorizer.transform([processed_text])
-
-        # Predict
-        prediction = self.model.predict(text_vec)[0]
-        probabilities = self.model.predict_proba(text_vec)[0]
+    def classify_texts(self, texts: List[str]) -> List[Dict]:
+        """
+        Classify a batch of texts with a single pipeline call — one sparse
+        transform and one predict_proba for the whole batch instead of a
+        full sklearn round trip per text.
 
-        # Prepare results
-        category = self.label_decoder[prediction]
-        confidence = probabilities[prediction]
+        Args:
+            texts (List[str]): Texts to classify
 
-        # Get probabilities for all categories
-        prob_dict = {
-            self.label_decoder[i]: prob for i, prob in enumerate(probabilities)
-        }
+        Returns:
+            List[Dict]: One classification result per input text
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before classification")
 
-        # Generate explanation
-        explanation = self._generate_explanation(category, confidence, prob_dict)
+        # Tokenize each text exactly once; the token lists feed both the
+        # hashing stage (via the pretokenized analyzer) and the
+        # processed-length stat, instead of a second tokenize+stem pass.
+        # One predict_proba call is enough — predict() would redo the same
+        # transform and scoring just to take the argmax we compute here.
+        token_lists = [_vec_tokenizer(text) for text in texts]
+        hash_step = self.pipeline.named_steps["hash"]
+        # Hashing is stateless, so a throwaway twin of the fitted step
+        # (same features/sign/norm/dtype) produces identical columns
+        hasher = HashingVectorizer(
+            n_features=hash_step.n_features,
+            alternate_sign=hash_step.alternate_sign,
+            norm=hash_step.norm,
+            dtype=hash_step.dtype,
+            analyzer=_pretokenized_analyzer,
+        )
+        X = self.pipeline.named_steps["tfidf"].transform(
+            hasher.transform(token_lists)
+        )
+        all_probabilities = self.pipeline.named_steps["clf"].predict_proba(X)
+        predictions = np.argmax(all_probabilities, axis=1)
+
+        results = []
+        for text, tokens, prediction, probabilities in zip(
+            texts, token_lists, predictions, all_probabilities
+        ):
+            # Prepare results
+            category = self.label_decoder[int(prediction)]
+            # float() casts: the float32 feature path yields np.float32
+            # probabilities, which JSON encoders won't serialize
+            confidence = float(probabilities[prediction])
+
+            # Get probabilities for all categories
+            prob_dict = {
+                self.label_decoder[i]: float(prob)
+                for i, prob in enumerate(probabilities)
+            }
+
+            # Generate explanation
+            explanation = self._generate_explanation(category, confidence, prob_dict)
+
+            results.append(
+                {
+                    "predicted_category": category,
+                    "confidence": confidence,
+                    "probabilities": prob_dict,
+                    "explanation": explanation,
+                    "model_used": self.model_type,
+                    "text_length": len(text),
+                    # len of " ".join(tokens) without building the string
+                    "processed_text_length": (
+                        sum(map(len, tokens)) + max(len(tokens) - 1, 0)
+                    ),
+                }
+            )
 
-        return {
-            "predicted_category": category,
-            "confidence": confidence,
-            "probabilities": prob_dict,
-            "explanation": explanation,
-            "model_used": self.model_type,
-            "text_length": len(text),
-            "processed_text_length": len(processed_text),
-        }
+        return results
 
     def _generate_explanation(
         self, category: str, confidence: float, probabilities: Dict[str, float]
@@ -316,8 +419,7 @@ class DocumentClassificationSystem:
             raise ValueError("Model must be trained before saving")
 
         model_data = {
-            "model": self.model,
-            "vectorizer": self.vectorizer,
+            "pipeline": self.pipeline,
             "label_encoder": self.label_encoder,
             "label_decoder": self.label_decoder,
             "model_type": self.model_type,
@@ -332,8 +434,7 @@ class DocumentClassificationSystem:
         with open(filepath, "rb") as f:
             model_data = pickle.load(f)
 
-        self.model = model_data["model"]
-        self.vectorizer = model_data["vectorizer"]
+        self.pipeline = model_data["pipeline"]
         self.label_encoder = model_data["label_encoder"]
         self.label_decoder = model_data["label_decoder"]
         self.model_type = model_data["model_type"]
@@ -380,16 +481,42 @@ def test_classification_system():
 # Global classifier instances for the API
 _classifiers = {}
 
+# Trained models are pickled here, keyed by a digest of the training CSV, so
+# restarts skip retraining while the data is unchanged.
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+
+def _training_data_digest(data_dir="../data") -> str:
+    """Digest of the training CSV contents; changes whenever the data does."""
+    training_file = os.path.join(data_dir, "training_documents.csv")
+    try:
+        with open(training_file, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()[:16]
+    except FileNotFoundError:
+        return "fallback"
+
 
 def _get_classifier(model_type="naive_bayes"):
     """Get or create a classifier instance for the given model type"""
     if model_type not in _classifiers:
-        _classifiers[model_type] = DocumentClassificationSystem(model_type=model_type)
-        # Auto-train the model when first created
+        classifier = DocumentClassificationSystem(model_type=model_type)
+        cache_file = os.path.join(
+            _CACHE_DIR, f"{model_type}-{_training_data_digest()}.pkl"
+        )
         try:
-            _classifiers[model_type].train_model()
-        except Exception as e:
-            print(f"Warning: Could not auto-train {model_type} model: {e}")
+            classifier.load_model(cache_file)
+        except Exception:
+            # Auto-train the model when no valid cached model exists
+            try:
+                classifier.train_model()
+                # Atomic write so concurrent workers never read a partial file
+                os.makedirs(_CACHE_DIR, exist_ok=True)
+                tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+                classifier.save_model(tmp_file)
+                os.replace(tmp_file, cache_file)
+            except Exception as e:
+                print(f"Warning: Could not auto-train {model_type} model: {e}")
+        _classifiers[model_type] = classifier
     return _classifiers[model_type]
 
 
@@ -408,6 +535,21 @@ def classify_document(text: str, model_type: str = "naive_bayes") -> Dict:
     return classifier.classify_text(text)
 
 
+def classify_documents(texts: List[str], model_type: str = "naive_bayes") -> List[Dict]:
+    """
+    Classify a batch of documents in one model call (for API micro-batching)
+
+    Args:
+        texts: The texts to classify
+        model_type: The model type ('naive_bayes' or 'logistic_regression')
+
+    Returns:
+        List of classification result dictionaries, in input order
+    """
+    classifier = _get_classifier(model_type)
+    return classifier.classify_texts(texts)
+
+
 def get_model_info(model_type: str = "naive_bayes") -> Dict:
     """
     Get information about the classification model (for API compatibility)
@@ -429,14 +571,13 @@ def train_models() -> Dict:
     Returns:
         Training results for both models
     """
-    results = {}
-
-    for model_type in ["naive_bayes", "logistic_regression"]:
-        classifier = _get_classifier(model_type)
-        training_result = classifier.train_model()
-        results[model_type] = training_result
+    def _train_one(model_type: str) -> Tuple[str, Dict]:
+        return model_type, _get_classifier(model_type).train_model()
 
-    return results
+    # sklearn's fits release the GIL, so the two model types train
+    # concurrently on the shared feature matrix
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        return dict(pool.map(_train_one, ["naive_bayes", "logistic_regression"]))
 
 
 if __name__ == "__main__":
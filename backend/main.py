@@ -1,7 +1,11 @@
+import asyncio
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from search import SearchEngine, load_publications
-from classification_ml import classify_document, get_model_info, train_models
+from search import SearchEngine, load_publications, publications_fingerprint
+from classification_ml import classify_documents, get_model_info, train_models
+from nlp_common import warm_up
 from fastapi.middleware.cors import CORSMiddleware
 
 app = FastAPI()
@@ -21,9 +25,71 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Load publications data once when the app starts
+# Load publications data once when the app starts; the fingerprint lets the
+# engine reuse its pickled TF-IDF index when the data file has not changed
 publications_data = load_publications()
-search_engine = SearchEngine(publications_data)
+search_engine = SearchEngine(publications_data, cache_key=publications_fingerprint())
+
+
+# Micro-batching for /classify: requests arriving within a short window are
+# classified with a single predict_proba call, amortizing the fixed sklearn
+# dispatch cost across concurrent requests.
+CLASSIFY_BATCH_MAX = 64
+CLASSIFY_BATCH_WINDOW = 0.005  # seconds
+
+_classify_queue: "asyncio.Queue[tuple]" = asyncio.Queue()
+
+
+async def _classify_batcher():
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _classify_queue.get()]
+        deadline = loop.time() + CLASSIFY_BATCH_WINDOW
+        while len(batch) < CLASSIFY_BATCH_MAX:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_classify_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # Group by model type so each group is a single batched predict
+        groups: dict = {}
+        for item in batch:
+            groups.setdefault(item[0], []).append(item)
+        for model_type, items in groups.items():
+            texts = [text for _, text, _ in items]
+            try:
+                results = await run_in_threadpool(classify_documents, texts, model_type)
+                for (_, _, future), result in zip(items, results):
+                    if not future.done():
+                        future.set_result(result)
+            except Exception as e:
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+
+
+@app.on_event("startup")
+async def _start_classify_batcher():
+    asyncio.create_task(_classify_batcher())
+
+
+@app.on_event("startup")
+async def _warm_nlp():
+    # Warm the lazy pieces (stopwords, stemmer, first search transform, and
+    # classifier training or cache load) in a thread, off the event loop, so
+    # the first real request doesn't absorb the cold-start cost.
+    def _warm():
+        try:
+            warm_up()
+            search_engine.search("warm up")
+            classify_documents(["warm up"], "naive_bayes")
+        except Exception:
+            pass
+
+    asyncio.get_running_loop().run_in_executor(None, _warm)
 
 
 # Pydantic models for request bodies
@@ -40,54 +106,38 @@ def read_root():
 @app.get("/search")
 def search_publications(query: str = "", page: int = 1, size: int = 30):
     try:
+        # Clamp so a page below 1 cannot produce a negative range/slice
+        start_idx = max((page - 1) * size, 0)
+        end_idx = start_idx + size
+
         # If no query provided, return all publications
         if not query.strip():
-            results = []
-            for pub in publications_data:
-                item = dict(pub)  # copy
-                item["score"] = 0.0  # no search score for all results
-
-                # Ensure authors is a list
-                if not isinstance(item.get("authors", []), list):
-                    item["authors"] = (
-                        item.get("authors", "").split(", ")
-                        if item.get("authors")
-                        else []
-                    )
-
-                # Return standard fields
-                return_fields = [
-                    "title",
-                    "link",
-                    "authors",
-                    "published_date",
-                    "abstract",
-                    "score",
-                ]
-                formatted_item = {k: item.get(k, "") for k in return_fields}
-                results.append(formatted_item)
+            # The engine already normalized every record into column lists,
+            # so only the requested page's rows are materialized as dicts
+            total = len(search_engine.publications)
+            paginated_results = [
+                search_engine._row(i, 0.0)
+                for i in range(start_idx, min(end_idx, total))
+            ]
         else:
             # Perform search using the initialized search engine
             results = search_engine.search(query)
-
-        # Apply pagination
-        start_idx = (page - 1) * size
-        end_idx = start_idx + size
-        paginated_results = results[start_idx:end_idx]
+            total = len(results)
+            paginated_results = results[start_idx:end_idx]
 
         return {
             "results": paginated_results,
-            "total": len(results),
+            "total": total,
             "page": page,
             "size": size,
-            "total_pages": (len(results) + size - 1) // size,
+            "total_pages": (total + size - 1) // size,
         }
     except Exception as e:
         return {"error": str(e)}
 
 
 @app.post("/classify")
-def classify_text(request: ClassificationRequest):
+async def classify_text(request: ClassificationRequest):
     """
     Classify text into business, health, or politics categories using ML models
     """
@@ -95,8 +145,9 @@ def classify_text(request: ClassificationRequest):
         if not request.text.strip():
             return {"error": "Text is required for classification"}
 
-        result = classify_document(request.text, request.model_type)
-        return result
+        future = asyncio.get_running_loop().create_future()
+        await _classify_queue.put((request.model_type, request.text, future))
+        return await future
     except Exception as e:
         return {"error": str(e)}
 
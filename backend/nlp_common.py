@@ -0,0 +1,65 @@
+"""
+Shared NLP plumbing for the backend: NLTK bootstrap, stopword set and
+stemming. search.py and classification_ml.py used to each download the
+corpus and build their own stopword set / stemmer on import; this module
+does that work exactly once per process.
+"""
+
+import functools
+from typing import List
+
+import nltk
+from nltk.corpus import stopwords
+from nltk.stem import PorterStemmer
+
+# PyStemmer is a C implementation of the Snowball stemmers; optional, with
+# NLTK's pure-Python PorterStemmer as the fallback.
+try:
+    import Stemmer
+except ImportError:
+    Stemmer = None
+
+
+@functools.lru_cache(maxsize=1)
+def ensure_nltk():
+    # Only the stopword corpus is needed; the regex tokenizers replaced
+    # word_tokenize, so no Punkt data is required.
+    try:
+        _ = stopwords.words("english")
+    except LookupError:
+        nltk.download("stopwords")
+
+
+ensure_nltk()
+
+STEMMER = PorterStemmer()
+_PYSTEMMER = Stemmer.Stemmer("english") if Stemmer is not None else None
+
+# frozenset precomputes hashes, which speeds up the membership test in the
+# tokenize loops.
+STOP = frozenset(stopwords.words("english"))
+
+
+@functools.lru_cache(maxsize=200_000)
+def stem(token: str) -> str:
+    """Memoized stem — token vocabularies are Zipfian, so most calls
+    become a cache hit."""
+    if _PYSTEMMER is not None:
+        return _PYSTEMMER.stemWord(token)
+    return STEMMER.stem(token)
+
+
+def stem_words(tokens: List[str]) -> List[str]:
+    """Stem a batch of tokens; with PyStemmer this is a single C call for
+    the whole list instead of one Python round trip per token."""
+    if _PYSTEMMER is not None:
+        return _PYSTEMMER.stemWords(tokens)
+    return [stem(t) for t in tokens]
+
+
+def warm_up():
+    """Touch the lazy pieces (stopword lookup, stemmer tables) so the first
+    real request doesn't pay for them."""
+    ensure_nltk()
+    _ = "warming" in STOP
+    stem_words(["warming", "tokens"])
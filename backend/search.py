@@ -1,13 +1,32 @@
 # search_engine.py  — upgraded for crawler with abstract + published_date
-import json, re, nltk
+import json, os, pickle, re
 from typing import List, Dict
-from nltk.corpus import stopwords
-from nltk.stem import PorterStemmer
+import numpy as np
+from joblib import Parallel, delayed
+from nlp_common import STOP, stem_words
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
 
 
 # ---------- IO ----------
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+
+def publications_fingerprint(
+    filepath_primary="../data/publications.json",
+    filepath_fallback="../data/publications_detailed.json",
+) -> str:
+    """Cheap identity of the publications file (mtime + size), used to decide
+    whether a pickled TF-IDF index is still valid."""
+    for path in (filepath_primary, filepath_fallback):
+        try:
+            st = os.stat(path)
+            return f"{st.st_mtime_ns}-{st.st_size}"
+        except OSError:
+            continue
+    return ""
+
+
 def load_publications(
     filepath_primary="../data/publications.json",
     filepath_fallback="../data/publications_detailed.json",
@@ -24,33 +43,20 @@ def load_publications(
     return data
 
 
-# ---------- NLTK helpers ----------
-def _ensure_nltk():
-    try:
-        _ = stopwords.words("english")
-        nltk.word_tokenize("ok")
-    except LookupError:
-        nltk.download("stopwords")
-        nltk.download("punkt")
-        # Some environments need this extra package; ignore if unavailable
-        try:
-            nltk.download("punkt_tab")
-        except Exception:
-            pass
-
+# Strip anything that isn't a lowercase alphanumeric or whitespace; applied to
+# already-lowercased text so a plain str.split yields the tokens.
+_PUNCT_RE = re.compile(r"[^a-z0-9\s]")
 
-_ensure_nltk()
-STEM = PorterStemmer()
-STOP = set(stopwords.words("english"))
+# Tokens are lowercase alphanumeric runs; findall on lowercased text replaces
+# the old lower → re.sub → word_tokenize sequence in one pass.
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
 
 
 def preprocess_text(text: str) -> str:
     if not text:
         return ""
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
-    tokens = nltk.word_tokenize(text)
-    return " ".join(STEM.stem(t) for t in tokens if t not in STOP and len(t) > 1)
+    tokens = [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOP and len(t) > 1]
+    return " ".join(stem_words(tokens))
 
 
 # ---------- normalization ----------
@@ -94,59 +100,162 @@ def _normalize_record(r: Dict) -> Dict:
     return out
 
 
+def _build_blob(pub: Dict) -> str:
+    """Build the searchable string (title + authors + abstract) for one
+    publication. Top-level so joblib's loky backend can pickle it."""
+    title = pub.get("title", "")
+    authors_objects = pub.get("authors", [])
+    authors_text = " ".join(
+        [
+            author.get("name", "") if isinstance(author, dict) else str(author)
+            for author in authors_objects
+        ]
+    )
+    abstract = pub.get("abstract", "")
+    raw = f"{title} {authors_text} {abstract}".lower()
+    stop = STOP
+    tokens = [t for t in _PUNCT_RE.sub(" ", raw).split() if t not in stop and len(t) > 1]
+    return " ".join(stem_words(tokens))
+
+
+# Below this corpus size, loky worker startup costs more than it saves.
+_PARALLEL_MIN_DOCS = 500
+
+
 # ---------- Engine ----------
 class SearchEngine:
-    def __init__(self, publications: List[Dict]):
+    def __init__(self, publications: List[Dict], cache_key: str = ""):
         # normalize all records so frontend fields always exist
         self.publications = [_normalize_record(p) for p in publications]
 
-        # Build searchable strings (title + authors + abstract)
-        self.searchable_content = []
-        for pub in self.publications:
-            title = pub.get("title", "")
-            # Extract author names for search indexing
-            authors_objects = pub.get("authors", [])
-            authors_text = " ".join(
-                [
-                    author.get("name", "") if isinstance(author, dict) else str(author)
-                    for author in authors_objects
-                ]
-            )
-            abstract = pub.get("abstract", "")
-            blob = f"{preprocess_text(title)} {preprocess_text(authors_text)} {preprocess_text(abstract)}"
-            self.searchable_content.append(blob)
+        # Columnar (structure-of-arrays) copies of the returned fields, so
+        # building a result row touches five list slots instead of copying
+        # and re-keying a whole publication dict per hit.
+        self.titles = [p.get("title", "") for p in self.publications]
+        self.links = [p.get("link", "") for p in self.publications]
+        self.authors_list = [p["authors"] for p in self.publications]
+        self.dates = [p["published_date"] for p in self.publications]
+        self.abstracts = [p["abstract"] for p in self.publications]
+
+        # Reload a previously fitted index when the publications file has not
+        # changed — re-fitting on every boot was redundant work on restarts.
+        cache_path = (
+            os.path.join(_CACHE_DIR, "search_index.pkl") if cache_key else None
+        )
+        if cache_path and self._load_index(cache_path, cache_key):
+            return
 
-        # TF-IDF over combined text
-        self.vectorizer = TfidfVectorizer()
+        # Build searchable strings (title + authors + abstract), fanning out
+        # across cores for large corpora — each document is independent, so
+        # preprocessing is embarrassingly parallel. The vectorizer fit stays
+        # single-threaded (sklearn's vocabulary build is not thread-safe).
+        if len(self.publications) > _PARALLEL_MIN_DOCS:
+            self.searchable_content = Parallel(
+                n_jobs=-1, backend="loky", batch_size=256
+            )(delayed(_build_blob)(p) for p in self.publications)
+        else:
+            self.searchable_content = [_build_blob(p) for p in self.publications]
+
+        # TF-IDF over combined text; the blobs are already lowercased and
+        # whitespace-tokenized, so sklearn's own preprocessing is skipped.
+        # float32 halves the bytes moved per query dot product (and the
+        # pickled index size); the precision is irrelevant for ranking.
+        self.vectorizer = TfidfVectorizer(
+            lowercase=False, tokenizer=str.split, token_pattern=None,
+            dtype=np.float32,
+        )
         self.tfidf_matrix = self.vectorizer.fit_transform(self.searchable_content)
+        # Rows are L2-normalized once here, so cosine similarity at query time
+        # reduces to a plain sparse matrix-vector product.
+        self.tfidf_matrix = normalize(self.tfidf_matrix, norm="l2", copy=False)
+        # term -> document inverted index for candidate pruning in search()
+        self.tfidf_matrix_T = self.tfidf_matrix.T.tocsr()
+
+        if cache_path:
+            self._save_index(cache_path, cache_key)
+
+    def _load_index(self, cache_path: str, cache_key: str) -> bool:
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("key") != cache_key:
+                return False
+            self.vectorizer = cached["vectorizer"]
+            self.tfidf_matrix = cached["tfidf_matrix"]
+            self.tfidf_matrix_T = self.tfidf_matrix.T.tocsr()
+            # Only needed while fitting; not worth persisting.
+            self.searchable_content = []
+            return True
+        except Exception:
+            return False
+
+    def _save_index(self, cache_path: str, cache_key: str):
+        # Atomic write; a racing worker at worst redoes the fit, never reads
+        # a half-written pickle.
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(
+                    {
+                        "key": cache_key,
+                        "vectorizer": self.vectorizer,
+                        "tfidf_matrix": self.tfidf_matrix,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            pass
+
+    def _row(self, i: int, score: float) -> Dict:
+        """Stitch one result row from the column lists."""
+        return {
+            "title": self.titles[i],
+            "link": self.links[i],
+            "authors": self.authors_list[i],
+            "published_date": self.dates[i],
+            "abstract": self.abstracts[i],
+            "score": score,
+        }
 
     def search(self, query: str) -> List[Dict]:
         if not query.strip():
             return []
 
+        # transform() already L2-normalizes the query (vectorizer norm="l2"),
+        # so the dot product against the pre-normalized corpus matrix is the
+        # cosine similarity — without cosine_similarity's validation and
+        # per-call re-normalization of the full matrix.
         q_vec = self.vectorizer.transform([preprocess_text(query)])
-        sims = cosine_similarity(q_vec, self.tfidf_matrix).flatten()
+        if q_vec.nnz == 0:
+            return []
+
+        # Inverted-index pruning: only documents sharing at least one query
+        # term can score above zero, so collect their row ids from the
+        # transposed matrix and multiply just those rows. Selective queries
+        # touch a small fraction of the corpus.
+        indptr = self.tfidf_matrix_T.indptr
+        indices = self.tfidf_matrix_T.indices
+        cand = np.unique(
+            np.concatenate(
+                [indices[indptr[t] : indptr[t + 1]] for t in q_vec.indices]
+            )
+        )
+        if cand.size == 0:
+            return []
+        sims = (self.tfidf_matrix[cand] @ q_vec.T).toarray().ravel()
 
-        # top 50 with a small threshold
-        top_idx = sims.argsort()[-50:][::-1]
+        # top 50 with a small threshold; argpartition finds the top K in O(N)
+        # instead of argsort's O(N log N), then only the K winners get sorted
+        k = min(50, sims.size)
+        top = np.argpartition(sims, -k)[-k:]
+        top_idx = top[np.argsort(sims[top])[::-1]]
         results = []
-        for i in top_idx:
-            score = float(sims[i])
+        for j in top_idx:
+            score = float(sims[j])
             if score < 0.01:
                 continue
-            item = dict(self.publications[i])  # copy
-            item["score"] = round(score, 2)
-
-            # Ensure required fields exist for frontend
-            return_fields = [
-                "title",
-                "link",
-                "authors",
-                "published_date",
-                "abstract",
-                "score",
-            ]
-            formatted_item = {k: item.get(k, "") for k in return_fields}
-            results.append(formatted_item)
+            results.append(self._row(int(cand[j]), round(score, 2)))
 
         return results
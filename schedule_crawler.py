@@ -3,35 +3,39 @@
 Automatic scheduler for the crawler using APScheduler.
 Runs the crawler once per week (Sunday at midnight).
 """
-import subprocess
-from apscheduler.schedulers.background import BackgroundScheduler
-import time
-import os
+import sys
 
-# Path to your virtual environment and crawler script
-VENV_PATH = os.path.join(os.path.dirname(__file__), ".venv", "bin", "activate")
-CRAWLER_SCRIPT = os.path.join(os.path.dirname(__file__), "crawler", "crawler.py")
+from apscheduler.schedulers.blocking import BlockingScheduler
+
+from crawler.crawler import main as run_crawler_main
 
 
-# Function to run the crawler
 def run_crawler():
+    # In-process call: no shell, no venv re-activation, no fresh interpreter
+    # re-paying the selenium/lxml import cost — and failures surface here
+    # instead of vanishing into a subprocess.
     print("[Scheduler] Running crawler...")
-    # Activate venv and run crawler
-    subprocess.run(
-        f"source {VENV_PATH} && python {CRAWLER_SCRIPT}", shell=True, check=False
-    )
+    argv = sys.argv
+    sys.argv = argv[:1]  # let the crawler's argparse see its defaults
+    try:
+        run_crawler_main()
+    except SystemExit:
+        pass
+    except Exception as e:
+        print(f"[Scheduler] Crawler failed: {e}")
+    finally:
+        sys.argv = argv
     print("[Scheduler] Crawler finished.")
 
 
 if __name__ == "__main__":
-    scheduler = BackgroundScheduler()
+    # BlockingScheduler runs jobs on the main thread, replacing the
+    # BackgroundScheduler + wake-every-minute sleep loop.
+    scheduler = BlockingScheduler()
     # Schedule: every Sunday at midnight
     scheduler.add_job(run_crawler, "cron", day_of_week="sun", hour=0, minute=0)
     print("[Scheduler] Crawler scheduled to run every Sunday at midnight.")
-    scheduler.start()
     try:
-        while True:
-            time.sleep(60)
+        scheduler.start()
     except (KeyboardInterrupt, SystemExit):
-        scheduler.shutdown()
         print("[Scheduler] Scheduler stopped.")